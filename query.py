@@ -1,119 +1,264 @@
 import xml.etree.ElementTree as ET
+import bisect
+import hashlib
 import os
+import pickle
 import sys
+from dataclasses import dataclass
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # typo-tolerant suggestions are optional
+    process = None
+
+# Element paths used while loading, interned once at import
+_CALIBRATOR = sys.intern('calibrator')
+_J2000 = sys.intern('header/j2000')
+_B1950 = sys.intern('header/b1950')
+_BAND_PATH = sys.intern('bands/band')
+
+# Bump when the cached structure changes so old pickles are ignored
+_CACHE_VERSION = 2
+
+# Parsed databases are cached here, in a directory the user owns, rather
+# than next to XML files that may have been downloaded or shared
+CACHE_DIR = os.path.expanduser('~/.cache/vla_calibrators')
+
+@dataclass
+class Band:
+    """One row of a calibrator's band table."""
+    __slots__ = ('band', 'band_code', 'a', 'b', 'c', 'd', 'flux', 'uvmin', 'uvmax')
+    band: str
+    band_code: str
+    a: str
+    b: str
+    c: str
+    d: str
+    flux: str
+    uvmin: str
+    uvmax: str
+
+@dataclass
+class Calibrator:
+    """A calibrator with its J2000/B1950 positions and band table."""
+    __slots__ = ('iau_name', 'ra', 'dec', 'pc', 'pos_ref', 'alt_name',
+                 'b1950_name', 'b1950_ra', 'b1950_dec', 'bands')
+    iau_name: str
+    ra: str
+    dec: str
+    pc: str
+    pos_ref: str
+    alt_name: str
+    b1950_name: str
+    b1950_ra: str
+    b1950_dec: str
+    bands: list[Band]
+
+# XML tags in the order of the Band fields
+_BAND_TAGS = ('BAND', 'BAND_CODE', 'A_CODE', 'B_CODE', 'C_CODE', 'D_CODE',
+              'FLUX_JY', 'UVMIN_KLAMBDA', 'UVMAX_KLAMBDA')
+
+def _child_texts(el):
+    """Return {tag: text} for the direct children of an element."""
+    return {c.tag: (c.text or '') for c in el}
+
+def _calibrator_from_element(el):
+    """Build a Calibrator from a <calibrator> element, or None without J2000 data."""
+    j2000 = el.find(_J2000)
+    if j2000 is None:
+        return None
+    j = _child_texts(j2000)
+    b1950 = el.find(_B1950)
+    b = _child_texts(b1950) if b1950 is not None else {}
+    bands = []
+    for band in el.iterfind(_BAND_PATH):
+        vals = _child_texts(band)
+        bands.append(Band(*(vals.get(tag, '') for tag in _BAND_TAGS)))
+    return Calibrator(
+        iau_name=j.get('IAU_NAME', ''),
+        ra=j.get('RA', ''),
+        dec=j.get('DEC', ''),
+        pc=j.get('PC', ''),
+        pos_ref=j.get('POS_REF', ''),
+        alt_name=j.get('ALT_NAME', ''),
+        b1950_name=b.get('IAU_NAME', ''),
+        b1950_ra=b.get('RA', ''),
+        b1950_dec=b.get('DEC', ''),
+        bands=bands,
+    )
+
+def _parse_xml(xml_file):
+    """Parse the XML file in a single iterparse pass and build the indexes."""
+    calibrators = []
+    by_name = {}
+    by_band = {}
+    root = None
+    for event, el in ET.iterparse(xml_file, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = el
+            continue
+        if el.tag != _CALIBRATOR:
+            continue
+        calib = _calibrator_from_element(el)
+        # Everything needed is in the Calibrator now, drop the parsed elements
+        root.clear()
+        if calib is None:
+            continue
+        calibrators.append(calib)
+        # Keep the first occurrence, as the old linear scan did
+        by_name.setdefault(calib.iau_name.strip(), calib)
+        for band in calib.bands:
+            calibs = by_band.setdefault(band.band.strip(), [])
+            if not calibs or calibs[-1] is not calib:
+                calibs.append(calib)
+    return calibrators, by_name, by_band
+
+def _cache_path(xml_file):
+    """Return the cache file for an XML file, keyed by its absolute path."""
+    key = hashlib.sha1(os.path.realpath(xml_file).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, key + '.pkl')
+
+def _xml_digest(xml_file):
+    with open(xml_file, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
 
 def load_xml(xml_file):
-    """Load XML file and return root element."""
+    """Load the calibrator database from an XML file.
+
+    Returns (calibrators, by_name, by_band): the calibrators in file order,
+    a map from J2000 IAU_NAME to calibrator, and a map from band name to the
+    calibrators that have it. Calibrators without J2000 data are skipped.
+
+    The result is pickled under CACHE_DIR, keyed by the XML path, and
+    reused on later runs while the XML content is unchanged. On failure
+    returns (None, {}, {}).
+    """
     if not os.path.exists(xml_file):
         print(f"ERROR: XML file '{xml_file}' not found!")
-        return None
+        return None, {}, {}
+
+    cache_file = _cache_path(xml_file)
+    digest = _xml_digest(xml_file)
     try:
-        tree = ET.parse(xml_file)
-        return tree.getroot()
+        with open(cache_file, 'rb') as f:
+            version, cached_digest, data = pickle.load(f)
+        if version == _CACHE_VERSION and cached_digest == digest:
+            return data
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+            ImportError, ValueError, TypeError):
+        pass
+
+    try:
+        data = _parse_xml(xml_file)
     except ET.ParseError as e:
         print(f"ERROR: Failed to parse XML file: {e}")
-        return None
+        return None, {}, {}
 
-def find_calibrator_by_name(root, iau_name):
-    """Find and return calibrator element matching given J2000 IAU_NAME."""
-    if root is None:
-        return None
-        
-    for calib in root.findall('calibrator'):
-        j2000 = calib.find('header/j2000')
-        if j2000 is not None:
-            name = j2000.findtext('IAU_NAME', '').strip()
-            if name == iau_name:
-                return calib
-    return None
-
-def list_calibrators_by_band(root, band_name):
+    tmp_file = cache_file + '.part'
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((_CACHE_VERSION, digest, data), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # caching is best effort, e.g. read-only home directory
+    return data
+
+def find_calibrator_by_name(by_name, iau_name):
+    """Find and return calibrator matching given J2000 IAU_NAME."""
+    return by_name.get(iau_name)
+
+def list_calibrators_by_band(by_band, band_name):
     """Return list of calibrators having the specified band."""
-    if root is None:
-        return []
-        
-    found = []
-    for calib in root.findall('calibrator'):
-        bands = calib.findall('bands/band')
-        for band in bands:
-            if band.findtext('BAND', '').strip() == band_name:
-                found.append(calib)
-                break
-    return found
+    return by_band.get(band_name, [])
+
+def build_name_index(by_name):
+    """Return (lowercased names, names) as parallel lists for similar-name searches."""
+    names = list(by_name)
+    return [name.lower() for name in names], names
+
+def find_similar_names(name_index, name, limit=5):
+    """Return up to `limit` names similar to `name`.
+
+    Names that contain, or are contained in, `name` are returned first. If
+    there are none and rapidfuzz is installed, the closest names by edit
+    distance are returned instead, so typos like 0005+338 still match.
+    """
+    lower_names, names = name_index
+    nl = name.lower()
+    similar = [n for ln, n in zip(lower_names, names) if nl in ln or ln in nl][:limit]
+    if similar or process is None:
+        return similar
+    hits = process.extract(nl, lower_names, scorer=fuzz.ratio,
+                           limit=limit, score_cutoff=60)
+    return [names[idx] for _, _, idx in hits]
+
+def find_names_by_prefix(sorted_names, prefix):
+    """Return all names in the sorted name list that start with `prefix`."""
+    lo = bisect.bisect_left(sorted_names, prefix)
+    hi = bisect.bisect_left(sorted_names, prefix + '\uffff')
+    return sorted_names[lo:hi]
 
 def print_calibrator(calib):
-    """Print readable info about a calibrator element."""
+    """Print readable info about a calibrator."""
     if calib is None:
         print("No calibrator data to display.")
         return
-        
-    j2000 = calib.find('header/j2000')
-    b1950 = calib.find('header/b1950')
-    
-    if j2000 is None:
-        print("ERROR: Missing J2000 data for calibrator")
-        return
     
-    print(f"Calibrator: {j2000.findtext('IAU_NAME', 'N/A')} (J2000)")
-    print(f"  RA: {j2000.findtext('RA', '')}")
-    print(f"  DEC: {j2000.findtext('DEC', '')}")
-    print(f"  Position Code: {j2000.findtext('PC', '')}")
-    print(f"  Position Reference: {j2000.findtext('POS_REF', '')}")
-    print(f"  Alt Name: {j2000.findtext('ALT_NAME', '')}")
+    print(f"Calibrator: {calib.iau_name} (J2000)")
+    print(f"  RA: {calib.ra}")
+    print(f"  DEC: {calib.dec}")
+    print(f"  Position Code: {calib.pc}")
+    print(f"  Position Reference: {calib.pos_ref}")
+    print(f"  Alt Name: {calib.alt_name}")
     
-    if b1950 is not None and b1950.findtext('IAU_NAME'):
-        print(f"B1950 Name: {b1950.findtext('IAU_NAME')}")
-        print(f"  RA: {b1950.findtext('RA')}")
-        print(f"  DEC: {b1950.findtext('DEC')}")
+    if calib.b1950_name:
+        print(f"B1950 Name: {calib.b1950_name}")
+        print(f"  RA: {calib.b1950_ra}")
+        print(f"  DEC: {calib.b1950_dec}")
     
     print("Bands:")
-    bands_found = calib.findall('bands/band')
-    if not bands_found:
+    if not calib.bands:
         print("  No band data available")
     else:
-        for band in bands_found:
-            band_name = band.findtext('BAND', '')
-            band_code = band.findtext('BAND_CODE', '')
-            a_code = band.findtext('A_CODE', '')
-            b_code = band.findtext('B_CODE', '')
-            c_code = band.findtext('C_CODE', '')
-            d_code = band.findtext('D_CODE', '')
-            flux = band.findtext('FLUX_JY', '')
-            uvmin = band.findtext('UVMIN_KLAMBDA', '')
-            uvmax = band.findtext('UVMAX_KLAMBDA', '')
-            
-            print(f"  {band_name} [{band_code}]: "
-                  f"A={a_code} B={b_code} C={c_code} D={d_code} "
-                  f"Flux={flux} Jy "
-                  f"UVMIN={uvmin} UVMAX={uvmax}")
+        for band in calib.bands:
+            print(f"  {band.band} [{band.band_code}]: "
+                  f"A={band.a} B={band.b} C={band.c} D={band.d} "
+                  f"Flux={band.flux} Jy "
+                  f"UVMIN={band.uvmin} UVMAX={band.uvmax}")
     
     print("-" * 60)
 
 def interactive_query(xml_file):
     """Main interactive query function."""
     print(f"Loading XML file: {xml_file}")
-    root = load_xml(xml_file)
+    calibrators, by_name, by_band = load_xml(xml_file)
     
-    if root is None:
+    if calibrators is None:
         print("Failed to load XML file. Exiting.")
         return
     
-    calibrator_count = len(root.findall('calibrator'))
+    calibrator_count = len(calibrators)
     print(f"Loaded XML with {calibrator_count} calibrators.")
     
     if calibrator_count == 0:
         print("No calibrators found in XML file.")
         return
     
+    name_index = build_name_index(by_name)
+    sorted_names = sorted(by_name)
+    
     while True:
         print("\nChoose an option:")
         print("1. Find calibrator by J2000 IAU_NAME")
         print("2. List calibrators with a specified band")
         print("3. Show first 5 calibrators")
         print("4. Exit")
+        print("5. Search calibrators by J2000 IAU_NAME prefix")
         
         try:
-            choice = input("Enter choice (1-4): ").strip()
+            choice = input("Enter choice (1-5): ").strip()
         except (EOFError, KeyboardInterrupt):
             print("\nExiting.")
             break
@@ -129,22 +274,15 @@ def interactive_query(xml_file):
                 print("Please enter a valid calibrator name.")
                 continue
                 
-            calib = find_calibrator_by_name(root, name)
+            calib = find_calibrator_by_name(by_name, name)
             if calib:
                 print_calibrator(calib)
             else:
                 print(f"Calibrator '{name}' not found.")
                 # Show some similar names
-                similar = []
-                for c in root.findall('calibrator'):
-                    j2000 = c.find('header/j2000')
-                    if j2000 is not None:
-                        cname = j2000.findtext('IAU_NAME', '').strip()
-                        if name.lower() in cname.lower() or cname.lower() in name.lower():
-                            similar.append(cname)
-                
+                similar = find_similar_names(name_index, name)
                 if similar:
-                    print(f"Similar names found: {', '.join(similar[:5])}")
+                    print(f"Similar names found: {', '.join(similar)}")
                     
         elif choice == '2':
             try:
@@ -157,30 +295,39 @@ def interactive_query(xml_file):
                 print("Please enter a valid band name.")
                 continue
                 
-            calib_list = list_calibrators_by_band(root, band)
+            calib_list = list_calibrators_by_band(by_band, band)
             print(f"Found {len(calib_list)} calibrators with band '{band}'. Showing first 10:")
             
             for i, cal in enumerate(calib_list[:10]):
-                j2000 = cal.find('header/j2000')
-                if j2000 is not None:
-                    jname = j2000.findtext('IAU_NAME', 'Unknown')
-                    print(f"  {i+1}. {jname}")
+                print(f"  {i+1}. {cal.iau_name}")
                     
         elif choice == '3':
             print("First 5 calibrators in the database:")
-            for i, cal in enumerate(root.findall('calibrator')[:5]):
-                j2000 = cal.find('header/j2000')
-                if j2000 is not None:
-                    jname = j2000.findtext('IAU_NAME', 'Unknown')
-                    bands = len(cal.findall('bands/band'))
-                    print(f"  {i+1}. {jname} ({bands} bands)")
+            for i, cal in enumerate(calibrators[:5]):
+                print(f"  {i+1}. {cal.iau_name} ({len(cal.bands)} bands)")
+                    
+        elif choice == '5':
+            try:
+                prefix = input("Enter start of J2000 IAU_NAME (e.g., 0005): ").strip()
+            except (EOFError, KeyboardInterrupt):
+                print("\nOperation cancelled.")
+                continue
+                
+            if not prefix:
+                print("Please enter a valid name prefix.")
+                continue
+                
+            hits = find_names_by_prefix(sorted_names, prefix)
+            print(f"Found {len(hits)} calibrators starting with '{prefix}'. Showing first 20:")
+            for i, jname in enumerate(hits[:20]):
+                print(f"  {i+1}. {jname}")
                     
         elif choice == '4':
             print("Exiting.")
             break
             
         else:
-            print("Invalid choice. Please enter 1, 2, 3, or 4.")
+            print("Invalid choice. Please enter 1, 2, 3, 4, or 5.")
 
 def main():
     """Main function with command line argument support."""
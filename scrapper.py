@@ -1,168 +1,144 @@
 import requests
 from bs4 import BeautifulSoup, NavigableString
+import argparse
+import json
+import logging
+import os
 import re
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+from xml.sax.saxutils import escape
 
-def create_text_element(parent, tag, text):
-    el = ET.SubElement(parent, tag)
-    el.text = text if text is not None else ""
-    return el
+log = logging.getLogger(__name__)
 
-def indent(elem, level=0):
-    i = "\n" + level * "  "
-    if len(elem):
-        if not elem.text or not elem.text.strip():
-            elem.text = i + "  "
-        for e in elem:
-            indent(e, level+1)
-        if not elem.tail or not elem.tail.strip():
-            elem.tail = i
-    else:
-        if level and (not elem.tail or not elem.tail.strip()):
-            elem.tail = i
+J2000_FIELDS = ["IAU_NAME", "EQUINOX", "PC", "RA", "DEC", "POS_REF", "ALT_NAME"]
+B1950_FIELDS = ["IAU_NAME", "EQUINOX", "PC", "RA", "DEC"]
+BAND_FIELDS = ["BAND", "BAND_CODE", "A_CODE", "B_CODE", "C_CODE", "D_CODE",
+               "FLUX_JY", "UVMIN_KLAMBDA", "UVMAX_KLAMBDA"]
+
+# Whole numeric token, and one whose value is <= 0.05 Jy. As in the old
+# token parser, the flux is the first number above 0.05; smaller numbers
+# before it count as code tokens.
+_NUM = r"\d*\.?\d+(?=\s|$)"
+_SMALL_NUM = r"(?=\.?\d)0*(?:\.(?:0[0-4]\d*|050*|0*))?(?=\s|$)"
+_CODE = rf"(?:(?!{_NUM})\S+|{_SMALL_NUM})"
+
+# One band line: band, band code, A/B/C/D codes, flux, then the UV values.
+# Extra non-numeric tokens before the flux and any trailing text after the
+# UV values (e.g. "visplot") are ignored.
+BAND_RE = re.compile(
+    r"^\s*(?P<BAND>[0-9.]+(?:cm|mm))\s+(?P<BAND_CODE>[A-Z])"
+    rf"\s+(?P<A_CODE>{_CODE})\s+(?P<B_CODE>{_CODE})\s+(?P<C_CODE>{_CODE})\s+(?P<D_CODE>{_CODE})"
+    rf"(?:\s+{_CODE})*"
+    rf"\s+(?!{_SMALL_NUM})(?P<FLUX_JY>{_NUM})"
+    rf"(?P<UV>(?:\s+{_NUM})*)"
+    r"(?:\s+\S+)*\s*$"
+)
+NUM_RE = re.compile(r"\d*\.?\d+")
+
+# Header lines for the J2000 and B1950 positions of a calibrator
+JHEADER_RE = re.compile(
+    r"^(?:\[(?P<iauname>\S+)\]\([^\)]+\)|(?P<iauname2>\S+))\s+J2000\s+(?P<pc>\w)\s+(?P<ra>\S+)\s+(?P<dec>\S+)\s*(?P<posref>[A-Za-z0-9]+)?\s*(?P<altname>[A-Za-z0-9.]+)?"
+)
+BHEADER_RE = re.compile(
+    r"^(?:\[(?P<iauname>\S+)\]|(?P<iauname2>\S+))\s+B1950\s+(?P<pc>\w)\s+(?P<ra>\S+)\s+(?P<dec>\S+)"
+)
+
+# Band lines start with the band name and single-letter band code
+BAND_START_RE = re.compile(r'^\s*([0-9.]+(?:cm|mm))\s+([A-Z])\s+')
+
+# Markdown links, parenthesised URLs and bare URLs stripped by clean_line
+LINK_RE = re.compile(r"\[([^\]]*)\]\([^\)]*\)")
+URL_IN_PARENS_RE = re.compile(r"\([^\s)]+://[^\s)]+\)")
+URL_RE = re.compile(r"http[s]?://\S+")
+
+CALLIST_URL = "https://science.nrao.edu/facilities/vla/observing/callist"
+
+# Local copy of the callist page, revalidated with a conditional GET
+CACHE_DIR = Path("~/.cache/vla_callist").expanduser()
+
+# Characters that XML 1.0 does not allow anywhere in a document
+XML_ILLEGAL_RE = re.compile("[^\x09\x0A\x0D\x20-\uD7FF\uE000-\uFFFD\U00010000-\U0010FFFF]")
+
+# Start columns of the UVMIN/UVMAX fields in a cleaned band line
+UVMIN_COL = 35
+UVMAX_COL = 46
 
 def clean_line(s):
     """Clean markdown links, parentheses, stray URLs from a str line."""
-    s = re.sub(r"\[([^\]]*)\]\([^\)]*\)", r"\1", s)
-    s = re.sub(r"\([^\s)]+://[^\s)]+\)", '', s)  # Remove URLs in ()
-    s = re.sub(r"http[s]?://\S+", "", s)
+    s = LINK_RE.sub(r"\1", s)
+    s = URL_IN_PARENS_RE.sub('', s)  # Remove URLs in ()
+    s = URL_RE.sub("", s)
     return s.strip()
 
+def assign_uv_columns(uv_candidates):
+    """
+    Return (uvmin, uvmax) from (value, start position) pairs.
+    
+    The slot of each value is the number of column boundaries its start
+    reaches: 0 (before UVMIN), 1 (UVMIN) or 2 (UVMAX), computed without
+    branching. The first value in a slot wins. If neither UV column got a
+    value, a lone value is taken as UVMAX.
+    """
+    slots = ["", "", ""]
+    for value, pos in uv_candidates:
+        slot = (pos >= UVMIN_COL) + (pos >= UVMAX_COL)
+        if not slots[slot]:
+            slots[slot] = value
+    if not slots[1] and not slots[2] and uv_candidates:
+        slots[2] = uv_candidates[0][0]
+    return slots[1], slots[2]
+
 def parse_band_line_robust(line):
     """
-    Robust parser for VLA band lines using position-based UV parsing.
+    Parse a VLA band line with BAND_RE and assign UVMIN/UVMAX by column.
     
-    Uses actual column positions from header to correctly assign UVMIN/UVMAX values.
-    UVMIN starts at position 35, UVMAX starts at position 46.
+    Either UV value may be missing from a line, so each one
+    is placed by where it starts: UVMIN at position 35, UVMAX at 46.
     """
-    # Remove any trailing comments like "visplot"
-    original_line = line
-    line_clean = re.sub(r'\s+visplot\s*$', '', line).strip()
+    m = BAND_RE.match(line)
+    if not m:
+        log.debug("Line does not match band format: %r", line)
+        return None
     
-    print(f"    Parsing band line: '{line_clean}'")
+    # Values and start positions of the UV numbers, in one scan of their span
+    uv_candidates = [(n.group(), n.start())
+                     for n in NUM_RE.finditer(line, m.start("UV"), m.end("UV"))]
+    uvmin, uvmax = assign_uv_columns(uv_candidates)
     
-    try:
-        # Split the line into parts for basic parsing
-        parts = line_clean.split()
-        if len(parts) < 7:
-            print(f"    Not enough parts: {len(parts)}")
-            return None
-            
-        print(f"    Split parts: {parts}")
-        
-        # Extract basic fields using split method
-        band = parts[0]
-        
-        # Find flux position
-        flux_idx = -1
-        for i, part in enumerate(parts):
-            if re.match(r'^\d*\.?\d+$', part) and float(part) > 0.05:
-                flux_idx = i
-                break
-        
-        if flux_idx == -1:
-            print(f"    Could not find flux value")
-            return None
-            
-        flux = parts[flux_idx]
-        
-        # Extract codes (everything between band and flux)
-        codes = parts[1:flux_idx]
-        if len(codes) < 5:
-            print(f"    Not enough codes: {len(codes)}")
-            return None
-            
-        band_code = codes[0]
-        a_code = codes[1]
-        b_code = codes[2] 
-        c_code = codes[3]
-        d_code = codes[4]
-        
-        print(f"    Band: {band}, Code: {band_code}, Antenna codes: [{a_code},{b_code},{c_code},{d_code}], Flux: {flux}")
-        
-        # Position-based UV parsing using header-derived column positions
-        uvmin_col_pos = 35  # UVMIN column starts at position 35
-        uvmax_col_pos = 46  # UVMAX column starts at position 46
-        
-        uvmin = ""
-        uvmax = ""
-        
-        # Find all numeric values after the flux in the original line
-        uv_candidates = []
-        for i in range(flux_idx + 1, len(parts)):
-            if re.match(r'^\d*\.?\d+$', parts[i]):
-                # Find the position of this number in the original line
-                search_start = original_line.find(flux) + len(flux)
-                pos = original_line.find(parts[i], search_start)
-                uv_candidates.append((parts[i], pos))
-                print(f"      UV candidate: '{parts[i]}' at position {pos}")
-        
-        # Assign UV values based on column positions
-        # Check UVMAX first since it comes after UVMIN
-        for uv_value, pos in uv_candidates:
-            if pos >= uvmax_col_pos:  # Check UVMAX first
-                if not uvmax:
-                    uvmax = uv_value
-                    print(f"      Assigned UVMAX: '{uv_value}' (pos {pos} >= {uvmax_col_pos})")
-            elif pos >= uvmin_col_pos:  # Then check UVMIN
-                if not uvmin:
-                    uvmin = uv_value  
-                    print(f"      Assigned UVMIN: '{uv_value}' (pos {pos} >= {uvmin_col_pos})")
-            else:
-                print(f"      UV value '{uv_value}' at pos {pos} is before columns - ignoring")
-        
-        # Fallback logic
-        if not uvmin and not uvmax and uv_candidates:
-            # Single value - assign to UVMAX based on analysis
-            uvmax = uv_candidates[0][0]
-            print(f"      FALLBACK: Single UV '{uvmax}' assigned to UVMAX")
-        
-        result = {
-            "BAND": band,
-            "BAND_CODE": band_code,
-            "A_CODE": a_code,
-            "B_CODE": b_code,
-            "C_CODE": c_code,
-            "D_CODE": d_code,
-            "FLUX_JY": flux,
-            "UVMIN_KLAMBDA": uvmin,
-            "UVMAX_KLAMBDA": uvmax,
-        }
-        
-        print(f"    Final result: UVMIN='{uvmin}', UVMAX='{uvmax}'")
-        return result
-        
-    except Exception as e:
-        print(f"Error parsing band line '{original_line}': {e}")
-        return None
+    result = {k: m.group(k) for k in BAND_FIELDS[:7]}
+    result["UVMIN_KLAMBDA"] = uvmin
+    result["UVMAX_KLAMBDA"] = uvmax
+    
+    return result
 
 def parse_cal_block(block_lines):
+    """
+    Parse one calibrator block into plain data.
+    
+    Returns {"j2000": {...}, "b1950": {...}, "bands": [{...}, ...]} so the
+    result pickles cheaply when blocks are parsed in worker processes.
+    """
     bands = []
     header, b1950 = {}, {}
     
-    # Regex patterns for header parsing
-    jheader_pat = re.compile(
-        r"^(?:\[(?P<iauname>\S+)\]\([^\)]+\)|(?P<iauname2>\S+))\s+J2000\s+(?P<pc>\w)\s+(?P<ra>\S+)\s+(?P<dec>\S+)\s*(?P<posref>[A-Za-z0-9]+)?\s*(?P<altname>[A-Za-z0-9.]+)?"
-    )
-    bheader_pat = re.compile(
-        r"^(?:\[(?P<iauname>\S+)\]|(?P<iauname2>\S+))\s+B1950\s+(?P<pc>\w)\s+(?P<ra>\S+)\s+(?P<dec>\S+)"
-    )
-    
-    # Pattern to identify band lines - look for band format at start of line
-    band_line_pat = re.compile(r'^\s*([0-9.]+(?:cm|mm))\s+([A-Z])\s+')
-
     lines = [clean_line(l) for l in block_lines if l.strip() and 
              not l.strip().startswith('-') and 
              not l.strip().startswith('=') and 
              not l.strip().startswith('BAND')]
 
-    print(f"Processing calibrator block with {len(lines)} lines")
+    debug = log.isEnabledFor(logging.DEBUG)
+    if debug:
+        log.debug("Processing calibrator block with %d lines", len(lines))
     
     for i, s in enumerate(lines):
-        print(f"  Line {i}: '{s}'")
+        if debug:
+            log.debug("  Line %d: %r", i, s)
         
         # Try J2000 header
-        m = jheader_pat.match(s)
+        m = JHEADER_RE.match(s)
         if m:
             iau = m.group('iauname') or m.group('iauname2')
             header = {
@@ -174,11 +150,12 @@ def parse_cal_block(block_lines):
                 "POS_REF": m.group('posref') or "",
                 "ALT_NAME": m.group('altname') or "",
             }
-            print(f"    Found J2000 header: {iau}")
+            if debug:
+                log.debug("    Found J2000 header: %s", iau)
             continue
             
         # Try B1950 header
-        m = bheader_pat.match(s)
+        m = BHEADER_RE.match(s)
         if m:
             iau = m.group('iauname') or m.group('iauname2')
             b1950 = {
@@ -188,94 +165,249 @@ def parse_cal_block(block_lines):
                 "RA": m.group('ra') or "",
                 "DEC": m.group('dec') or "",
             }
-            print(f"    Found B1950 header: {iau}")
+            if debug:
+                log.debug("    Found B1950 header: %s", iau)
             continue
             
         # Try band data - use robust parsing
-        if band_line_pat.match(s):
+        if BAND_START_RE.match(s):
             band_data = parse_band_line_robust(s)
-                
-            if band_data:
+            if band_data is None:
+                log.warning("Skipping band line that does not match the band format: %r", s)
+            else:
                 bands.append(band_data)
-                print(f"    Added band: {band_data['BAND']} code={band_data['BAND_CODE']} with antenna codes [{band_data['A_CODE']},{band_data['B_CODE']},{band_data['C_CODE']},{band_data['D_CODE']}], UVMIN={band_data['UVMIN_KLAMBDA']}, UVMAX={band_data['UVMAX_KLAMBDA']}")
+                if debug:
+                    log.debug("    Added band: %s code=%s with antenna codes [%s,%s,%s,%s], UVMIN=%s, UVMAX=%s",
+                              *(band_data[k] for k in BAND_FIELDS))
+
+    if debug:
+        log.debug("Parsed calibrator: %s with %d bands", header.get('IAU_NAME', 'Unknown'), len(bands))
+    return {"j2000": header, "b1950": b1950, "bands": bands}
 
-    # Create XML structure
-    root = ET.Element("calibrator")
-    header_el = ET.SubElement(root, "header")
-    jheader_el = ET.SubElement(header_el, "j2000")
-    for tag in ["IAU_NAME","EQUINOX","PC","RA","DEC","POS_REF","ALT_NAME"]:
-        create_text_element(jheader_el, tag, header.get(tag, ""))
-    bheader_el = ET.SubElement(header_el, "b1950")
-    for tag in ["IAU_NAME","EQUINOX","PC","RA","DEC"]:
-        create_text_element(bheader_el, tag, b1950.get(tag,""))
-    bands_el = ET.SubElement(root, "bands")
-    for band in bands:
-        band_el = ET.SubElement(bands_el, "band")
-        for k in ["BAND","BAND_CODE","A_CODE", "B_CODE", "C_CODE", "D_CODE", "FLUX_JY", "UVMIN_KLAMBDA","UVMAX_KLAMBDA"]:
-            create_text_element(band_el, k, band.get(k,""))
+def _parse_cal_block_safe(block_lines):
+    """Worker wrapper: return (data, None) or (None, error message)."""
+    try:
+        return parse_cal_block(block_lines), None
+    except Exception as e:
+        return None, str(e)
+
+def _xml_fields(fields, tags):
+    """Serialize `tags` of the `fields` dict as escaped child elements."""
+    return "".join(f"<{tag}>{escape(XML_ILLEGAL_RE.sub('', fields.get(tag) or ''))}</{tag}>"
+                   for tag in tags)
+
+def _init_worker_logging(level):
+    """Process pool initializer: apply the parent's log level in the worker.
     
-    print(f"Created XML for calibrator: {header.get('IAU_NAME', 'Unknown')} with {len(bands)} bands")
-    return root
+    Under the spawn/forkserver start methods workers start with logging
+    unconfigured, so DEBUG diagnostics would otherwise be lost.
+    """
+    logging.basicConfig(level=level)
+    logging.getLogger().setLevel(level)
 
-def scrape_and_export_xml(url, xml_file="vla_calibrators_from_web_fixed.xml"):
-    print(f"Scraping VLA calibrator list from: {url}")
-    resp = requests.get(url)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, 'html.parser')
+def build_calibrator_element(cal):
+    """Build the <calibrator> element for a parse_cal_block result."""
+    # One C-level parse of the formatted markup instead of a SubElement
+    # call per field
+    bands = "".join(f"<band>{_xml_fields(band, BAND_FIELDS)}</band>" for band in cal["bands"])
+    return ET.fromstring(
+        "<calibrator><header>"
+        f"<j2000>{_xml_fields(cal['j2000'], J2000_FIELDS)}</j2000>"
+        f"<b1950>{_xml_fields(cal['b1950'], B1950_FIELDS)}</b1950>"
+        f"</header><bands>{bands}</bands></calibrator>"
+    )
 
-    results = []
-    in_block = False
-    block_lines = []
-    calibrator_count = 0
+def iter_cal_blocks(texts):
+    """
+    Yield the lines of each calibrator block in the given <pre> texts.
     
-    # Search every <pre> tag (calibrators are in preformatted blocks)
-    for pre in soup.find_all('pre'):
-        lines = pre.get_text().splitlines()
-        for idx, line in enumerate(lines):
-            # Every block starts with calibrator J2000 entry
+    Single pass over the lines: a block starts at a J2000 line and ends at
+    the next blank line, the next J2000 line or the end of the text.
+    """
+    for text in texts:
+        block_lines = None
+        for line in text.splitlines():
             if "J2000" in line:
-                in_block = True
+                if block_lines:
+                    yield block_lines
                 block_lines = [line]
-                continue
-            if in_block:
-                block_lines.append(line)
-                # Each block ends with a blank line or EOF
-                if idx+1 == len(lines) or not lines[idx+1].strip():
-                    print(f"\n=== Processing calibrator {calibrator_count + 1} ===")
-                    try:
-                        xmlnode = parse_cal_block(block_lines)
-                        results.append(xmlnode)
-                        calibrator_count += 1
-                    except Exception as e:
-                        print(f"Error processing calibrator block: {e}")
-                        print(f"Block lines were: {block_lines}")
-                    in_block = False
+            elif block_lines is not None:
+                if line.strip():
+                    block_lines.append(line)
+                else:
+                    yield block_lines
+                    block_lines = None
+        if block_lines:
+            yield block_lines
+
+def _write_bytes_atomic(path, data):
+    """Write `data` to a temporary file next to `path`, then move it into place."""
+    tmp_path = path.with_name(path.name + ".part")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+
+def _read_cached_callist(url, meta_file, body_file):
+    """Return (conditional GET headers, cached body) for `url`, or ({}, None)."""
+    try:
+        meta = json.loads(meta_file.read_text())
+        body = body_file.read_bytes()
+    except (OSError, ValueError):
+        return {}, None
+    if not isinstance(meta, dict) or meta.get("url") != url:
+        return {}, None
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers, body
+
+def fetch_callist(url, cache_dir=CACHE_DIR, session=None):
+    """
+    Return the callist page body, reusing the cached copy when unchanged.
+    
+    The ETag/Last-Modified of the last download are sent back to the server;
+    a 304 reply means the cached body is still current. Pass a
+    requests.Session to reuse its connection across several fetches.
+    
+    Caching is best effort: an unusable cache directory or a damaged cache
+    only costs a full download.
+    """
+    meta_file = cache_dir / "meta.json"
+    body_file = cache_dir / "callist.html"
+    headers, cached_body = _read_cached_callist(url, meta_file, body_file)
+    
+    resp = (session or requests).get(url, headers=headers)
+    if resp.status_code == 304 and cached_body is not None:
+        log.info("Callist unchanged since last download, using cached copy")
+        return cached_body
+    resp.raise_for_status()
+    
+    # Body first, so meta.json never describes a body that was not saved
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        _write_bytes_atomic(body_file, resp.content)
+        _write_bytes_atomic(meta_file, json.dumps({
+            "url": url,
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }).encode("utf-8"))
+    except OSError as e:
+        log.warning("Could not update callist cache in %s: %s", cache_dir, e)
+    return resp.content
+
+def scrape_and_export_xml(url, xml_file="vla_calibrators_from_web_fixed.xml", session=None,
+                          max_workers=None):
+    """
+    Scrape the callist at `url` and write it to `xml_file`.
+    
+    Calibrator blocks are parsed in a process pool of `max_workers`
+    processes (default: one per CPU); max_workers=1 parses in this process.
+    """
+    print(f"Scraping VLA calibrator list from: {url}")
+    soup = BeautifulSoup(fetch_callist(url, session=session), 'lxml')
+    
+    # Search every <pre> tag (calibrators are in preformatted blocks)
+    pre_texts = (pre.get_text() for pre in soup.find_all('pre'))
+    blocks = list(iter_cal_blocks(pre_texts))
 
-    # Create final XML
-    root = ET.Element("calibrators")
-    for node in results:
-        root.append(node)
-    indent(root)
-    tree = ET.ElementTree(root)
-    tree.write(xml_file, encoding="utf-8", xml_declaration=True)
-    print(f"\nExtracted {len(results)} calibrators. XML saved as {xml_file}")
+    summary = []  # first few calibrators, kept for the summary below
+    calibrator_count = 0
+    
+    # Calibrators are written out as they are parsed, so the whole
+    # document never has to be held in memory. They go to a temporary
+    # file that only replaces xml_file once complete, so a failed run
+    # leaves the previous XML untouched.
+    tmp_file = xml_file + ".part"
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.write("<?xml version='1.0' encoding='utf-8'?>\n<calibrators>\n")
+        
+            # Blocks are independent, so parse them in parallel and build the
+            # XML here, in block order, from the returned plain data
+            with ExitStack() as stack:
+                if max_workers == 1:
+                    parsed = map(_parse_cal_block_safe, blocks)
+                else:
+                    ex = stack.enter_context(ProcessPoolExecutor(
+                        max_workers=max_workers, initializer=_init_worker_logging,
+                        initargs=(logging.getLogger().getEffectiveLevel(),)))
+                    parsed = ex.map(_parse_cal_block_safe, blocks, chunksize=32)
+            
+                for block_lines, (cal, error) in zip(blocks, parsed):
+                    if error is not None:
+                        log.error("Error processing calibrator block: %s", error)
+                        log.error("Block lines were: %s", block_lines)
+                        continue
+                    try:
+                        xmlnode = build_calibrator_element(cal)
+                    except ET.ParseError as e:
+                        log.error("Error building XML for calibrator block: %s", e)
+                        log.error("Block lines were: %s", block_lines)
+                        continue
+                    ET.indent(xmlnode, space="  ", level=1)
+                    f.write("  " + ET.tostring(xmlnode, encoding="unicode") + "\n")
+                    if len(summary) < 5:
+                        summary.append(xmlnode)
+                    calibrator_count += 1
+        
+            f.write("</calibrators>\n")
+        os.replace(tmp_file, xml_file)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+    print(f"\nExtracted {calibrator_count} calibrators. XML saved as {xml_file}")
     
     # Print a summary of the first few calibrators
     print("\n=== SUMMARY ===")
-    for i, result in enumerate(results[:5]):
-        name = result.find('.//IAU_NAME')
-        name_text = name.text if name is not None else "Unknown"
+    for i, result in enumerate(summary):
+        name_text = result.findtext('.//IAU_NAME') or "Unknown"
         bands = result.findall('.//band')
         print(f"{i+1}. {name_text}: {len(bands)} bands")
         for band in bands[:3]:  # Show first 3 bands
-            band_name = band.find('BAND').text if band.find('BAND') is not None else ""
-            a_code = band.find('A_CODE').text if band.find('A_CODE') is not None else ""
-            b_code = band.find('B_CODE').text if band.find('B_CODE') is not None else ""
-            c_code = band.find('C_CODE').text if band.find('C_CODE') is not None else ""
-            d_code = band.find('D_CODE').text if band.find('D_CODE') is not None else ""
-            uvmin = band.find('UVMIN_KLAMBDA').text if band.find('UVMIN_KLAMBDA') is not None else ""
-            uvmax = band.find('UVMAX_KLAMBDA').text if band.find('UVMAX_KLAMBDA') is not None else ""
+            band_name = band.findtext('BAND', '')
+            a_code = band.findtext('A_CODE', '')
+            b_code = band.findtext('B_CODE', '')
+            c_code = band.findtext('C_CODE', '')
+            d_code = band.findtext('D_CODE', '')
+            uvmin = band.findtext('UVMIN_KLAMBDA', '')
+            uvmax = band.findtext('UVMAX_KLAMBDA', '')
             print(f"   {band_name}: Codes=[{a_code},{b_code},{c_code},{d_code}] UVMIN={uvmin}, UVMAX={uvmax}")
 
+def _positive_int(value):
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Scrape the NRAO VLA calibrator list into an XML file.")
+    parser.add_argument("-o", "--output", default="vla_calibrators_from_web_fixed.xml",
+                        help="XML file to write (default: %(default)s)")
+    parser.add_argument("--url", default=CALLIST_URL,
+                        help="calibrator list page (default: %(default)s)")
+    parser.add_argument("-j", "--workers", type=_positive_int, default=None,
+                        help="processes used to parse calibrator blocks (default: one per CPU)")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="log per-line parser diagnostics")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    with requests.Session() as session:
+        scrape_and_export_xml(args.url, args.output, session=session,
+                              max_workers=args.workers)
+
 if __name__ == "__main__":
-    scrape_and_export_xml("https://science.nrao.edu/facilities/vla/observing/callist")
+    main()
@@ -0,0 +1,80 @@
+import xml.etree.ElementTree as ET
+
+from scrapper import build_calibrator_element, parse_band_line_robust, parse_cal_block
+
+# One calibrator block as it appears in the NRAO callist <pre> text. In the
+# band lines UVMIN values start at column 35 and UVMAX values at column 46.
+BLOCK = """\
+[0005+383](http://example.org/0005+383)   J2000  A 00h05m57.175378s  38d20'15.148570"  Aug01    3C2
+0003+380   B1950  A 00h03m22.400000s  38d03'33.000000"
+-----------------------------------------------------
+BAND        A B C D    FLUX(Jy)    UVMIN(kL)  UVMAX(kL)
+=====================================================
+ 20cm    L  P  P  P  P       0.62                    40    visplot
+  6cm    C  P  S  S  S       0.71         5          300
+  2cm    U  P  S  S  S  W    1.10
+ 0.7cm   Q  X  X  X  S  0.03  0.15   visplot
+"""
+
+
+def band_values(calibrator, band_name):
+    for band in calibrator.iterfind("bands/band"):
+        if band.findtext("BAND") == band_name:
+            return {child.tag: child.text or "" for child in band}
+    raise AssertionError(f"band {band_name} not found")
+
+
+def test_parse_cal_block_builds_expected_xml():
+    calibrator = build_calibrator_element(parse_cal_block(BLOCK.splitlines()))
+
+    j2000 = calibrator.find("header/j2000")
+    assert j2000.findtext("IAU_NAME") == "0005+383"
+    assert j2000.findtext("RA") == "00h05m57.175378s"
+    assert j2000.findtext("POS_REF") == "Aug01"
+    assert j2000.findtext("ALT_NAME") == "3C2"
+    assert calibrator.findtext("header/b1950/IAU_NAME") == "0003+380"
+    assert [b.findtext("BAND") for b in calibrator.iterfind("bands/band")] == [
+        "20cm", "6cm", "2cm", "0.7cm"]
+
+    # Lone UV value in the UVMAX column, trailing visplot
+    assert band_values(calibrator, "20cm") == {
+        "BAND": "20cm", "BAND_CODE": "L", "A_CODE": "P", "B_CODE": "P",
+        "C_CODE": "P", "D_CODE": "P", "FLUX_JY": "0.62",
+        "UVMIN_KLAMBDA": "", "UVMAX_KLAMBDA": "40",
+    }
+
+    # UVMIN and UVMAX both present
+    six = band_values(calibrator, "6cm")
+    assert (six["FLUX_JY"], six["UVMIN_KLAMBDA"], six["UVMAX_KLAMBDA"]) == ("0.71", "5", "300")
+
+    # Extra code token before the flux is ignored
+    two = band_values(calibrator, "2cm")
+    assert (two["D_CODE"], two["FLUX_JY"], two["UVMIN_KLAMBDA"], two["UVMAX_KLAMBDA"]) == (
+        "S", "1.10", "", "")
+
+    # Numbers <= 0.05 Jy are not taken as the flux
+    q = band_values(calibrator, "0.7cm")
+    assert (q["D_CODE"], q["FLUX_JY"]) == ("S", "0.15")
+
+
+def test_build_calibrator_element_output_is_stable():
+    calibrator = build_calibrator_element(parse_cal_block(BLOCK.splitlines()[:2]))
+    assert ET.tostring(calibrator, encoding="unicode") == (
+        "<calibrator><header>"
+        "<j2000><IAU_NAME>0005+383</IAU_NAME><EQUINOX>J2000</EQUINOX><PC>A</PC>"
+        "<RA>00h05m57.175378s</RA><DEC>38d20'15.148570\"</DEC>"
+        "<POS_REF>Aug01</POS_REF><ALT_NAME>3C2</ALT_NAME></j2000>"
+        "<b1950><IAU_NAME>0003+380</IAU_NAME><EQUINOX>B1950</EQUINOX><PC>A</PC>"
+        "<RA>00h03m22.400000s</RA><DEC>38d03'33.000000\"</DEC></b1950>"
+        "</header><bands /></calibrator>"
+    )
+
+
+def test_band_line_with_too_few_codes_is_rejected():
+    assert parse_band_line_robust("20cm L P P P 1.5 2.0") is None
+
+
+def test_small_leading_number_is_not_the_flux():
+    band = parse_band_line_robust("20cm L P P P P 0.03 1.2")
+    assert band["FLUX_JY"] == "1.2"
+    assert band["UVMIN_KLAMBDA"] == band["UVMAX_KLAMBDA"] == ""